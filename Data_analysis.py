@@ -9,16 +9,38 @@ Usage:
     python data_analytics_report.py
 
 Dependencies:
-    pip install pandas matplotlib PyPDF2
+    pip install pandas matplotlib pymupdf    (or pypdf / PyPDF2 as slower fallbacks)
 """
 
 from pathlib import Path
+import io
+import mmap
 import re
+from contextlib import contextmanager
 from collections import defaultdict
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use('Agg')       # file output only — pandas' DataFrame.plot still pulls in pyplot
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.backends.backend_pdf import PdfPages
-import PyPDF2
+try:
+    import pymupdf              # PyMuPDF: MuPDF's C text extractor, far faster than the pure-Python readers
+except ImportError:
+    try:
+        import fitz as pymupdf  # PyMuPDF < 1.24 only exposes the legacy 'fitz' name
+        if not hasattr(pymupdf, 'Document'):
+            pymupdf = None      # unrelated PyPI package also called 'fitz'
+    except ImportError:
+        pymupdf = None
+if pymupdf is not None:
+    pdf_lib = None
+else:
+    try:
+        import pypdf as pdf_lib     # maintained successor of PyPDF2 with a faster text extractor
+    except ImportError:
+        import PyPDF2 as pdf_lib
 import argparse
 import datetime
 
@@ -29,114 +51,248 @@ INPUT_PDF = Path("Data Analytics Assignment.pdf")   # change if needed
 OUTPUT_PDF = Path("Data_Analytics_Report.pdf")      # generated report
 VERBOSE = True
 
+# Pre-compiled patterns (avoid re-compiling / cache lookups inside per-line loops)
+# One line of daily text: optional ISO date (+ time) or 'DD Mon [to DD Mon]' prefix, then the rest.
+# [^\S\n] is "whitespace except newline" so a match never runs into the next line.
+_LINE_RE = re.compile(
+    r'^[^\S\n]*'
+    r'(?:(?P<iso>20\d{2}-\d{2}-\d{2})(?:[^\S\n]+\d{1,2}:\d{2}:\d{2})?\b'
+    r'|(?P<ddmon>\d{1,2}[^\S\n]+\w+(?:[^\S\n]+[Tt][Oo][^\S\n]+\d{1,2}[^\S\n]+\w+)?)[^\S\n]+(?=\S))?'
+    r'(?P<rest>[^\n]*)$',
+    re.M,       # no re.I: 'to' is the only letter literal, spelled out as [Tt][Oo]
+)
+# Every line boundary str.splitlines() recognises, mapped to '\n' so the re.M patterns split lines the same way
+_LINE_BREAKS = str.maketrans(dict.fromkeys('\r\v\f\x1c\x1d\x1e\x85\u2028\u2029', '\n'))
+_ANYISO_RE = re.compile(r'(20\d{2}-\d{2}-\d{2})')
+# Last whitespace-delimited numeric token on a line: greedy '.*' lets the engine scan from the right.
+_TRAIL_NUM_RE = re.compile(r'^.*(?<!\S)(-?\d+(?:\.\d+)?)(?!\S)')
+# Same, but one match per line of a '\n'-joined text (empty group when a line has no number)
+_TRAIL_NUM_LINES_RE = re.compile(r'^(?:.*(?<!\S)(-?\d+(?:\.\d+)?)(?!\S))?.*$', re.M)
+_DAILY_RE = re.compile(r'Daily Data\s*\n(.*?)\n\s*Hourly Data', re.S | re.I)
+_DAILY_TAIL_RE = re.compile(r'Daily Data\s*\n(.*)', re.S | re.I)
+_TOTAL_RE = re.compile(r'\n\s*Total Data\s*\n', re.I)
+
 # ---------------------------
 # Helper functions
 # ---------------------------
+def _page_text(page) -> str:
+    """Text of a single page, or '' if extraction fails."""
+    try:
+        if pymupdf is not None:
+            return page.get_text("text") or ""
+        return page.extract_text() or ""
+    except Exception:
+        return ""
+
+def _join_pages(page_texts) -> str:
+    """Joins page texts with newlines, streaming into one buffer instead of a list + join."""
+    buf = io.StringIO()
+    for i, t in enumerate(page_texts):
+        if i:
+            buf.write("\n")
+        buf.write(t)
+    return buf.getvalue()
+
+@contextmanager
+def _open_pdf(pdf_path):
+    """
+    Yields a PdfReader over a read-only memory map of the file: one mapping shared with the
+    OS page cache instead of buffered read() calls, and only the regions touched get paged in.
+    """
+    with open(pdf_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        yield pdf_lib.PdfReader(data, strict=False)
+
 def extract_pdf_text(pdf_path: Path) -> str:
-    """Extracts text from all pages of the PDF and returns combined string."""
-    reader = PyPDF2.PdfReader(str(pdf_path))
-    pages_text = []
-    for i, p in enumerate(reader.pages):
-        try:
-            pages_text.append(p.extract_text() or "")
-        except Exception:
-            pages_text.append("")
-    return "\n".join(pages_text)
-
-def split_app_blocks(text: str) -> list:
+    """
+    Extracts text from all pages of the PDF and returns combined string.
+    Uses PyMuPDF when installed, otherwise pypdf/PyPDF2.
+    """
+    if pymupdf is not None:
+        with pymupdf.open(str(pdf_path)) as doc:
+            return _join_pages(_page_text(p) for p in doc)
+
+    with _open_pdf(pdf_path) as reader:
+        return _join_pages(_page_text(p) for p in reader.pages)
+
+def _block_spans(text: str, low: str):
+    """
+    Yields (start, stop) offsets of the app blocks in text, delimited by 'Total Data' headings.
+    low is text.lower() (same length). Lazy, so callers can process each block as it is found.
+    """
+    # delimiter is '\n' + optional whitespace + 'Total Data' + whitespace ending in '\n'
+    block_start = None      # None while still in the header/intro before the first delimiter
+    pos = 0
+    i = low.find('total data')
+    while i >= 0:
+        begin = end = -1
+        k = i - 1
+        while k >= pos and text[k].isspace():
+            if text[k] == '\n':
+                begin = k
+            k -= 1
+        j = i + len('total data')
+        while j < len(text) and text[j].isspace():
+            if text[j] == '\n':
+                end = j + 1
+            j += 1
+        if begin >= 0 and end >= 0:
+            if block_start is not None:
+                yield block_start, begin
+            block_start = pos = end
+            i = low.find('total data', end)
+        else:
+            i = low.find('total data', i + 1)
+    # no delimiter at all: entire doc as single block
+    yield (0 if block_start is None else block_start), len(text)
+
+def _daily_span(text: str, low: str, lo: int, hi: int):
+    """
+    Offsets (start, stop) of the 'Daily Data' ... 'Hourly Data' section within text[lo:hi],
+    or of everything after 'Daily Data' if there is no 'Hourly Data'. None if no 'Daily Data'.
+    """
+    # 'Daily Data' heading followed by whitespace containing at least one newline;
+    # the section starts after the last newline of that run
+    last_nl = prev_nl = -1      # last newline in the heading's whitespace run, and the one before it
+    i = low.find('daily data', lo, hi)
+    while i >= 0:
+        j = i + len('daily data')
+        while j < hi and text[j].isspace():
+            if text[j] == '\n':
+                prev_nl = last_nl
+                last_nl = j
+            j += 1
+        if last_nl >= 0:
+            break
+        i = low.find('daily data', i + 1, hi)
+    if last_nl < 0:
+        return None
+    start = last_nl + 1
+
+    # first 'Hourly Data' preceded by whitespace that contains a newline
+    h = first_h = low.find('hourly data', start, hi)
+    while h >= 0:
+        end = -1
+        k = h - 1
+        while k >= start and text[k].isspace():
+            if text[k] == '\n':
+                end = k
+            k -= 1
+        if end >= 0:
+            return start, end
+        h = low.find('hourly data', h + 1, hi)
+    if first_h >= 0 and prev_nl >= 0 and not text[start:first_h].strip():
+        # e.g. 'Daily Data\n\nHourly Data' -> '' (not the tail): the regex backtracks so the
+        # heading ends at prev_nl and last_nl serves as the '\n' before 'Hourly Data'
+        return prev_nl + 1, last_nl
+    return start, hi
+
+def split_app_blocks(text: str, text_lower: str = None) -> list:
     """
     Splits the long PDF text into blocks using the heading 'Total Data' as delimiter.
     Each block usually corresponds to one application's section of the provided PDF.
+    Pass text_lower (text.lower()) if the caller already has it, to skip lowercasing again.
     """
-    parts = re.split(r'\n\s*Total Data\s*\n', text, flags=re.IGNORECASE)
-    # first part is header/intro; subsequent parts are blocks
-    if len(parts) <= 1:
-        return [text]    # fallback: entire doc as single block
-    return parts[1:]
-
-def find_daily_section(block: str) -> str:
+    low = text.lower() if text_lower is None else text_lower
+    if len(low) != len(text):
+        # lower() changed the length (rare non-ASCII case) — indices won't line up, use regex
+        parts = _TOTAL_RE.split(text)
+        # first part is header/intro; subsequent parts are blocks
+        if len(parts) <= 1:
+            return [text]    # fallback: entire doc as single block
+        return parts[1:]
+    return [text[lo:hi] for lo, hi in _block_spans(text, low)]
+
+def find_daily_section(block: str, block_lower: str = None) -> str:
     """
     Returns the text between 'Daily Data' and 'Hourly Data' inside a block, if present.
     If not present, returns the substring after 'Daily Data' or the whole block fallback.
+    Pass block_lower (block.lower()) if the caller already has it, to skip lowercasing again.
     """
-    m = re.search(r'Daily Data\s*\n(.*?)\n\s*Hourly Data', block, re.S | re.I)
-    if m:
-        return m.group(1)
-    m2 = re.search(r'Daily Data\s*\n(.*)', block, re.S | re.I)
-    if m2:
-        return m2.group(1)
-    return ""
-
-def parse_daily_lines_to_rows(daily_text: str) -> list:
+    low = block.lower() if block_lower is None else block_lower
+    if len(low) != len(block):
+        # lower() changed the length (rare non-ASCII case) — indices won't line up, use regex
+        m = _DAILY_RE.search(block)
+        if m:
+            return m.group(1)
+        m2 = _DAILY_TAIL_RE.search(block)
+        return m2.group(1) if m2 else ""
+    span = _daily_span(block, low, 0, len(block))
+    return block[span[0]:span[1]] if span else ""
+
+def split_app_sections(text: str, text_lower: str = None) -> list:
+    """
+    One pass over the text: returns (block, daily_text) per app block, i.e. split_app_blocks()
+    and find_daily_section() combined, sharing a single lowercased copy of the whole text.
+    Markers are located in the lowercased copy; blocks are sliced from text to keep original case.
+    """
+    low = text.lower() if text_lower is None else text_lower
+    if len(low) != len(text):
+        return [(block, find_daily_section(block)) for block in split_app_blocks(text, low)]
+    sections = []
+    for lo, hi in _block_spans(text, low):
+        span = _daily_span(text, low, lo, hi)
+        sections.append((text[lo:hi], text[span[0]:span[1]] if span else ""))
+    return sections
+
+def parse_daily_lines_to_rows(daily_text: str) -> dict:
     """
     Heuristically parse lines that may contain a date and numeric values (IVT).
     Strategy:
         - For ISO-date lines: ^YYYY-MM-DD (optionally time) ...
         - For lines like '11 Sep to 15 Sep' or '11 Sep to 15 Sep 1191603 ... 0.00427' detect date phrase and last numeric token
         - Use last numeric token in the line as the IVT-like metric if it's numeric.
-    Returns list of tuples: (date_str, parsed_date_or_None, rest_text, ivt_value_or_None)
+    Returns dict of columns: date_raw, date_parsed (DatetimeIndex, NaT if not an ISO date), rest, IVT (float64 array, NaN if missing)
     """
-    rows = []
-    for ln in daily_text.splitlines():
-        ln = ln.strip()
-        if not ln:
-            continue
+    # ISO date strings and IVT are extracted per row in one batch at the end
+    date_raw, date_iso, rests = [], [], []
+    # '\r\n' becomes '\n\n'; the extra empty line is skipped like any blank line
+    daily_text = daily_text.translate(_LINE_BREAKS)
+    for m in _LINE_RE.finditer(daily_text):
+        rest = m.group('rest').strip()
         # Try ISO date format: 2025-09-12 0:00:00  ...
-        iso = re.match(r'^(20\d{2}-\d{2}-\d{2})(?:\s+\d{1,2}:\d{2}:\d{2})?\b(.*)$', ln)
-        if iso:
-            date_str = iso.group(1)
-            rest = iso.group(2).strip()
-            tokens = re.split(r'\s+', rest) if rest else []
-            ivt = _last_numeric_token(tokens)
-            rows.append((date_str, _try_parse_date(date_str), rest, ivt))
-            continue
-
+        date_str = m.group('iso')
+        if date_str:
+            raw, iso = date_str, date_str
         # Try 'DD Mon' or 'DD Mon to DD Mon' patterns at start
-        m2 = re.match(r'^(\d{1,2}\s+\w+(?:\s+to\s+\d{1,2}\s+\w+)?)\s+(.*)$', ln, re.I)
-        if m2:
-            date_like = m2.group(1)
-            rest = m2.group(2)
-            tokens = re.split(r'\s+', rest)
-            ivt = _last_numeric_token(tokens)
-            # no reliable absolute year — keep date as string only (parsed as None)
-            rows.append((date_like, None, rest, ivt))
+        elif m.group('ddmon'):
+            # no reliable absolute year — keep date as string only (parsed as NaT)
+            raw, iso = m.group('ddmon'), None
+        elif not rest:
             continue
-
-        # If line starts with a word-date like '11 Sep to 15 Sep 1191603 1189884 ... 0.00427'
-        # fallback: try to find first date-like substring anywhere
-        mm = re.search(r'(20\d{2}-\d{2}-\d{2})', ln)
-        if mm:
-            date_str = mm.group(1)
-            rest = ln.replace(date_str, '').strip()
-            tokens = re.split(r'\s+', rest)
-            ivt = _last_numeric_token(tokens)
-            rows.append((date_str, _try_parse_date(date_str), rest, ivt))
-            continue
-
-        # Generic fallback: attempt to pick last numeric token on the line
-        tokens = re.split(r'\s+', ln)
-        ivt = _last_numeric_token(tokens)
-        if ivt is not None:
-            # no parseable date — store raw line as date_raw
-            rows.append((ln[:40] + ("..." if len(ln)>40 else ""), None, ln, ivt))
-    return rows
-
-def _last_numeric_token(tokens):
-    """Return last numeric token from tokens list as float, else None."""
-    for t in reversed(tokens):
-        if re.match(r'^-?\d+(\.\d+)?$', t):
-            try:
-                return float(t)
-            except:
-                continue
-    return None
-
-def _try_parse_date(s):
-    """Try parse ISO or common date formats to a pandas.Timestamp, else None."""
-    try:
-        return pd.to_datetime(s, dayfirst=False, errors='coerce')
-    except:
-        return pd.NaT
+        else:
+            ln = rest
+            # If line starts with a word-date like '11 Sep to 15 Sep 1191603 1189884 ... 0.00427'
+            # fallback: try to find first date-like substring anywhere
+            mm = _ANYISO_RE.search(ln)
+            if mm:
+                date_str = mm.group(1)
+                raw, iso = date_str, date_str
+                rest = ln.replace(date_str, '').strip()
+            else:
+                # Generic fallback: attempt to pick last numeric token on the line
+                if _last_numeric_token(ln) is None:
+                    continue
+                # no parseable date — store raw line as date_raw
+                raw, iso = ln[:40] + ("..." if len(ln)>40 else ""), None
+        date_raw.append(raw)
+        date_iso.append(iso)
+        rests.append(rest)
+
+    # last numeric token of every row: one regex pass over the joined rows. Converted with float(),
+    # like _last_numeric_token, so non-ASCII digits and long integers parse (and round) identically.
+    tokens = _TRAIL_NUM_LINES_RE.findall("\n".join(rests)) if rests else ()
+    ivt = [float(t) if t else np.nan for t in tokens]     # '' -> NaN
+    return {
+        'date_raw': date_raw,
+        'date_parsed': pd.to_datetime(date_iso, format='%Y-%m-%d', errors='coerce'),
+        'rest': rests,
+        'IVT': np.asarray(ivt, dtype=np.float64),
+    }
+
+def _last_numeric_token(line_rest):
+    """Return last whitespace-separated numeric token in line_rest as float, else None."""
+    m = _TRAIL_NUM_RE.search(line_rest)
+    return float(m.group(1)) if m else None
 
 # ---------------------------
 # Main report generation
@@ -146,61 +302,78 @@ def generate_report(input_pdf: Path, output_pdf: Path, verbose: bool = True):
         raise FileNotFoundError(f"Input PDF not found: {input_pdf}")
 
     text = extract_pdf_text(input_pdf)
-    blocks = split_app_blocks(text)
+    text_lower = text.lower()   # lowercased once; all marker searches run on this copy
+    sections = split_app_sections(text, text_lower)
     if verbose:
-        print(f"Found {len(blocks)} app blocks (by 'Total Data' split).")
+        print(f"Found {len(sections)} app blocks (by 'Total Data' split).")
 
-    app_data = []   # list of dicts: {'index': i, 'block': block, 'rows': rows, 'df': df}
+    app_data = []   # list of dicts: {'index': i, 'block': block, 'df': df}
 
-    for i, block in enumerate(blocks, start=1):
-        daily_text = find_daily_section(block)
+    for i, (block, daily_text) in enumerate(sections, start=1):
         if not daily_text:
             # fallback: try to find any lines that look like daily rows within the block
             daily_text = block[:5000]  # just parse the head
-        rows = parse_daily_lines_to_rows(daily_text)
-        df = pd.DataFrame(rows, columns=['date_raw','date_parsed','rest','IVT'])
-        # keep only rows that have IVT numeric parsed
-        df['IVT'] = pd.to_numeric(df['IVT'], errors='coerce')
-        app_data.append({'index': i, 'block': block, 'rows': rows, 'df': df})
+        cols = parse_daily_lines_to_rows(daily_text)
+        df = pd.DataFrame(cols)     # IVT is already float64 (NaN where no numeric token)
+        app_data.append({'index': i, 'block': block, 'df': df})
         if verbose:
             print(f"App #{i} — parsed rows: {len(df)}  (rows with IVT: {df['IVT'].count()})")
 
     # Create PDF report with charts
     with PdfPages(str(output_pdf)) as pdf:
+        # Figures are created once and cleared between pages (construction/teardown is costly).
+        # Built directly on an Agg canvas rather than via pyplot, so they're never registered
+        # in pyplot's global figure manager and need no plt.close().
+        text_fig = Figure(figsize=(8.27, 11.69))
+        FigureCanvasAgg(text_fig)
+        chart_fig = Figure(figsize=(8.27, 5))
+        FigureCanvasAgg(chart_fig)
+        ax = chart_fig.add_subplot(111)
+        chart_bottom = chart_fig.subplotpars.bottom     # autofmt_xdate() moves it; restored per page
+
         # Title page
-        fig = plt.figure(figsize=(8.27, 11.69))
+        fig = text_fig
         fig.text(0.5, 0.8, "Data Analytics Assignment — Automated Report", ha='center', va='center', fontsize=18, weight='bold')
-        fig.text(0.5, 0.73, f"Source: {input_pdf.name}", ha='center', va='center', fontsize=9)
-        fig.text(0.1, 0.6, "Contents:", fontsize=12, weight='bold')
-        fig.text(0.12, 0.56, "1. Per-app IVT charts\n2. Combined IVT trends across apps\n3. Observations & Recommendations", fontsize=10)
-        fig.text(0.1, 0.28, f"Generated: {datetime.datetime.now().isoformat()}", fontsize=8)
-        plt.axis('off')
+        # everything below the heading is one multi-line Text artist (one layout / font lookup)
+        fig.text(0.1, 0.73,
+                 f"Source: {input_pdf.name}\n\n"
+                 "Contents:\n"
+                 "  1. Per-app IVT charts\n"
+                 "  2. Combined IVT trends across apps\n"
+                 "  3. Observations & Recommendations\n\n"
+                 f"Generated: {datetime.datetime.now().isoformat()}",
+                 va='top', fontsize=10, linespacing=1.5)
+        fig.add_subplot(111).axis('off')
         pdf.savefig(fig, bbox_inches='tight')
-        plt.close(fig)
 
-        combined_date_frames = []
         plotted_any = False
 
         for ad in app_data:
-            df = ad['df'].dropna(subset=['IVT']).copy()
-            if df.empty:
+            # per-app frames are small: plain NumPy masking/sorting beats pandas dropna/sort_values
+            ivt = ad['df']['IVT'].to_numpy()
+            dates = ad['df']['date_parsed'].to_numpy()
+            mask = ~np.isnan(ivt)
+            if not mask.any():
                 continue
             plotted_any = True
+            ivt, dates = ivt[mask], dates[mask]
 
             # prefer parsed dates if available, else use row index
-            if df['date_parsed'].notna().sum() > 0:
-                df_sorted = df.sort_values('date_parsed')
-                x = df_sorted['date_parsed']
+            dated = ~np.isnat(dates)
+            if dated.any():
+                order = np.argsort(dates[dated], kind='stable')
+                x = dates[dated][order]
+                y = ivt[dated][order]
                 x_label = 'Date'
             else:
-                df_sorted = df.reset_index(drop=True)
-                x = df_sorted.index
+                x = np.arange(len(ivt))
+                y = ivt
                 x_label = 'Row index'
 
-            y = df_sorted['IVT'].astype(float)
-
             # plot per-app
-            fig, ax = plt.subplots(figsize=(8.27, 5))
+            fig = chart_fig
+            ax.cla()
+            fig.subplots_adjust(bottom=chart_bottom)
             ax.plot(x, y, marker='o', linewidth=1)
             ax.set_title(f'App #{ad["index"]} — Extracted Daily IVT', fontsize=12)
             ax.set_xlabel(x_label)
@@ -209,20 +382,19 @@ def generate_report(input_pdf: Path, output_pdf: Path, verbose: bool = True):
             if x_label == 'Date':
                 fig.autofmt_xdate()
             pdf.savefig(fig, bbox_inches='tight')
-            plt.close(fig)
-
-            # if date-parsable, prepare for combined chart
-            if df_sorted['date_parsed'].notna().sum() > 0:
-                tmp = df_sorted[['date_parsed','IVT']].dropna().copy()
-                tmp = tmp.groupby('date_parsed', as_index=False)['IVT'].mean()
-                tmp = tmp.rename(columns={'IVT': f'IVT_app_{ad["index"]}'})
-                tmp = tmp.set_index('date_parsed')
-                combined_date_frames.append(tmp)
-
-        # Combined chart if at least two apps had date series
-        if combined_date_frames:
-            merged = pd.concat(combined_date_frames, axis=1).sort_index()
-            fig, ax = plt.subplots(figsize=(8.27, 5))
+
+        # Combined chart if at least two apps had date series:
+        # one long frame tagged by app, one groupby (sorted by date) instead of per-app frames + outer joins
+        big = pd.concat(
+            [ad['df'][['date_parsed', 'IVT']].assign(app_id=ad['index']) for ad in app_data],
+            ignore_index=True,
+        ).dropna(subset=['date_parsed', 'IVT']) if app_data else pd.DataFrame()
+        if not big.empty:
+            merged = big.groupby(['date_parsed', 'app_id'])['IVT'].mean().unstack('app_id')
+            merged.columns = [f'IVT_app_{i}' for i in merged.columns]
+            fig = chart_fig
+            ax.cla()
+            fig.subplots_adjust(bottom=chart_bottom)
             merged.plot(ax=ax, marker='o', linewidth=1)
             ax.set_title('Combined IVT trends (per app)', fontsize=12)
             ax.set_xlabel('Date')
@@ -230,7 +402,6 @@ def generate_report(input_pdf: Path, output_pdf: Path, verbose: bool = True):
             ax.grid(True, linestyle='--', linewidth=0.5, alpha=0.6)
             fig.autofmt_xdate()
             pdf.savefig(fig, bbox_inches='tight')
-            plt.close(fig)
 
         # Observations page (text summary)
         lines = []
@@ -241,12 +412,11 @@ def generate_report(input_pdf: Path, output_pdf: Path, verbose: bool = True):
             lines.append("Please provide the raw CSV/Excel for accurate structured analysis.")
         else:
             for ad in app_data:
-                df = ad['df'].dropna(subset=['IVT']).copy()
-                if df.empty:
+                ivt = ad['df']['IVT'].dropna()     # already float64; dropna returns a new Series
+                if ivt.empty:
                     continue
-                ivt = df['IVT'].astype(float)
                 lines.append(f"App #{ad['index']}:")
-                lines.append(f"  • Parsed rows: {len(df)}")
+                lines.append(f"  • Parsed rows: {len(ivt)}")
                 lines.append(f"  • IVT mean: {ivt.mean():.6f}")
                 lines.append(f"  • IVT median: {ivt.median():.6f}")
                 lines.append(f"  • IVT min/max: {ivt.min():.6f} / {ivt.max():.6f}")
@@ -264,15 +434,15 @@ def generate_report(input_pdf: Path, output_pdf: Path, verbose: bool = True):
             lines.append("")
             lines.append("Limitations: This is an automated heuristic parse of a PDF with inconsistent formatting. Use original structured files for higher-confidence analytics.")
 
-        # Render text page(s) into PDF (split if long)
+        # Render text page(s) into PDF (split if long): one Text artist, re-filled per page
         chunk_size = 45
+        fig = text_fig
+        fig.clf()
+        body = fig.text(0.01, 0.99, "", va='top', fontsize=9, family='monospace')
+        fig.add_subplot(111).axis('off')
         for i in range(0, len(lines), chunk_size):
-            slice_lines = lines[i:i+chunk_size]
-            fig = plt.figure(figsize=(8.27, 11.69))
-            fig.text(0.01, 0.99, "\n".join(slice_lines), va='top', fontsize=9, family='monospace')
-            plt.axis('off')
+            body.set_text("\n".join(lines[i:i+chunk_size]))
             pdf.savefig(fig, bbox_inches='tight')
-            plt.close(fig)
 
     if verbose:
         print(f"Saved report to: {output_pdf}")